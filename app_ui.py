@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from PIL import Image, ImageTk
-from multimedia_processor import ImageProcessor
+from multimedia_processor import DecodedImageCache, ImageProcessor
 import os
 
 
@@ -35,6 +35,14 @@ class ImageEditorAppUI:
 
         self.processor = ImageProcessor()
 
+        # NOTE: Decoded pixels of opened images are cached here for fast reopening.
+        # Set this to None to always decode images from the source file.
+        try:
+            self.pixel_cache = DecodedImageCache(
+                os.path.join(os.path.expanduser("~"), ".cache", "aesthetic_image_editor"))
+        except OSError:
+            self.pixel_cache = None
+
         # NOTE: Set the path to your background image here.
         self.background_image_path = "featured-image-3.png"
 
@@ -275,19 +283,27 @@ class ImageEditorAppUI:
         Opens a file dialog to select and display an image.
         It handles errors for invalid or corrupted files.
         """
-        file_path = filedialog.askopenfilename(filetypes=[("Image files", "*.png *.jpg *.jpeg *.bmp *.gif")])
+        file_path = filedialog.askopenfilename(filetypes=[("Image files", "*.png *.jpg *.jpeg *.bmp *.gif *.tif *.tiff")])
         if not file_path:
             return
 
         try:
-            new_image = Image.open(file_path)
+            if self.pixel_cache is not None:
+                new_image = self.pixel_cache.open(file_path)
+            else:
+                new_image = Image.open(file_path)
             if new_image.width > 0 and new_image.height > 0:
-                self.original_image = new_image.copy()
+                # Memory-mapped cache images are read-only and can be shared without copying
+                self.original_image = new_image if new_image.readonly else new_image.copy()
                 self.current_image = new_image.copy()
                 self.file_path = file_path  # Store the file path
-                self.processor.set_image(self.current_image)
+                # Pass the original so a memory-mapped source stays backed by the page cache
+                self.processor.set_image(self.original_image)
                 self.update_canvas_display()
-                self.status_bar.config(text=f"Opened: {file_path}")
+                if self.processor.original_image.readonly:
+                    self.status_bar.config(text=f"Opened (memory-mapped from cache): {file_path}")
+                else:
+                    self.status_bar.config(text=f"Opened: {file_path}")
                 self.toggle_widgets(tk.NORMAL)
             else:
                 self.status_bar.config(
@@ -370,7 +386,7 @@ class ImageEditorAppUI:
         """Resets the image to its original state."""
         if self.original_image:
             self.current_image = self.original_image.copy()
-            self.processor.set_image(self.current_image)
+            self.processor.set_image(self.original_image)
             self.brightness_slider.set(0)
             self.contrast_slider.set(0)
             self.saturation_slider.set(100)
@@ -1,5 +1,213 @@
 from PIL import Image, ImageEnhance, ImageFilter, ImageOps
 import numpy as np
+import ast
+import hashlib
+import os
+import struct
+import tempfile
+import time
+
+
+class DecodedImageCache:
+    """
+    An optional on-disk cache of decoded source pixels.
+    Each entry is a small header, the image metadata needed for saving, and the raw pixel data,
+    keyed by the source file's path, size and modification time. Entries are memory-mapped on
+    reopen, so the pixels are backed by the OS page cache instead of being decompressed into a
+    fresh heap allocation.
+    """
+
+    MAGIC = b"IPDC"
+    VERSION = 3
+    # magic, version, mode, width, height, source size, source mtime (ns), info length; padded to 64 bytes
+    HEADER_FORMAT = "<4sB15sIIQqI"
+    HEADER_SIZE = 64
+    # Only formats that are expensive to decode are worth their raw size on disk
+    CACHED_FORMATS = ("PNG", "TIFF")
+    # Image.info keys that Pillow writes back when saving; they are kept with the pixels
+    INFO_KEYS = ("icc_profile", "dpi", "resolution", "transparency", "gamma", "exif", "compression")
+    # Temporary files older than this are left over from a crashed or failed write
+    STALE_TEMP_SECONDS = 3600
+
+    def __init__(self, cache_dir, max_bytes=1024 * 1024 * 1024):
+        """
+        Initializes the cache.
+
+        Args:
+            cache_dir (str): Directory where the cache entries are stored.
+            max_bytes (int): Size cap for all entries; the least recently used are evicted first.
+
+        Raises:
+            OSError: If the cache directory cannot be created.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _entry_path(self, file_path):
+        """Returns the cache entry path for a source file, keyed by its absolute path."""
+        key = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key + ".raw")
+
+    def open(self, file_path):
+        """
+        Opens an image, reusing the cached decoded pixels when the source file is unchanged.
+        Falls back to decoding the source (and caching the result) on a miss.
+        """
+        stat = os.stat(file_path)
+        entry_path = self._entry_path(file_path)
+
+        image = self._load(entry_path, stat)
+        if image is not None:
+            try:
+                # Mark the entry as recently used for eviction
+                os.utime(entry_path)
+            except OSError:
+                pass
+            return image
+
+        # Closing the source only releases the file handle; the loaded pixels stay valid
+        with Image.open(file_path) as source:
+            source.load()
+            image_format = source.format
+        if image_format in self.CACHED_FORMATS:
+            self._store(entry_path, source, stat)
+        return source
+
+    def _load(self, entry_path, stat):
+        """Memory-maps a cache entry, or returns None if it is missing, stale or unreadable."""
+        try:
+            with open(entry_path, "rb") as entry:
+                header = entry.read(self.HEADER_SIZE)
+                if len(header) != self.HEADER_SIZE:
+                    return None
+                magic, version, mode, width, height, size, mtime_ns, info_length = struct.unpack_from(
+                    self.HEADER_FORMAT, header)
+                if magic != self.MAGIC or version != self.VERSION:
+                    return None
+                info_blob = entry.read(info_length)
+        except OSError:
+            return None
+
+        # The source file changed since it was cached, so the entry is invalid
+        if size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+            self._remove(entry_path)
+            return None
+
+        try:
+            mode = mode.rstrip(b"\0").decode("ascii")
+            info = ast.literal_eval(info_blob.decode("utf-8"))
+            if width == 0 or height == 0 or not isinstance(info, dict):
+                raise ValueError("Corrupted cache entry")
+            pixels = np.memmap(entry_path, dtype=np.uint8, mode="r",
+                               offset=self._pixel_offset(info_length))
+            # For modes Pillow can map (L, RGBA, RGBX, CMYK, I;16*) the image shares the mapped
+            # pages; other modes are unpacked straight from the mapping without decompression.
+            image = Image.frombuffer(mode, (width, height), pixels, "raw", mode, 0, 1)
+        except (OSError, ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            self._remove(entry_path)
+            return None
+        image.info.update(info)
+        return image
+
+    def _pixel_offset(self, info_length):
+        """Returns the offset of the pixel data, aligned to the header size."""
+        unaligned = self.HEADER_SIZE + info_length
+        return -(-unaligned // self.HEADER_SIZE) * self.HEADER_SIZE
+
+    def _serialize_info(self, image):
+        """
+        Serializes the metadata that affects saving as a Python literal.
+        Returns None if a value cannot be stored, in which case the image is not cached.
+        """
+        info = {}
+        for key in self.INFO_KEYS:
+            if key not in image.info:
+                continue
+            value = image.info[key]
+            # TIFF resolutions are IFDRational values, which are stored as plain floats
+            if isinstance(value, tuple):
+                value = tuple(v if isinstance(v, (int, float)) else float(v) for v in value)
+            info[key] = value
+
+        blob = repr(info)
+        try:
+            if ast.literal_eval(blob) != info:
+                return None
+        except (ValueError, SyntaxError):
+            return None
+        return blob.encode("utf-8")
+
+    def _store(self, entry_path, image, stat):
+        """Writes the decoded pixels of an image to the cache and enforces the size cap."""
+        # The palette is not part of the raw pixels, so palette images are not cached
+        if image.mode in ("P", "PA") or len(image.mode) > 15:
+            return
+        info_blob = self._serialize_info(image)
+        if info_blob is None:
+            return
+        # Caching is best-effort; a failure here must never stop the image from opening
+        try:
+            header = struct.pack(self.HEADER_FORMAT, self.MAGIC, self.VERSION, image.mode.encode("ascii"),
+                                 image.width, image.height, stat.st_size, stat.st_mtime_ns, len(info_blob))
+            data = image.tobytes("raw", image.mode)
+        except (struct.error, ValueError, MemoryError):
+            return
+        pixel_offset = self._pixel_offset(len(info_blob))
+        if pixel_offset + len(data) > self.max_bytes:
+            return
+
+        # Write to a unique temporary file first so a reader never sees a partial entry
+        # and concurrent writers of the same entry do not interfere
+        try:
+            fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as entry:
+                entry.write(header.ljust(self.HEADER_SIZE, b"\0"))
+                entry.write(info_blob.ljust(pixel_offset - self.HEADER_SIZE, b"\0"))
+                entry.write(data)
+            os.replace(temp_path, entry_path)
+        except OSError:
+            self._remove(temp_path)
+            return
+        self._evict()
+
+    def _evict(self):
+        """
+        Removes the least recently used entries until the cache fits within max_bytes.
+        Temporary files count towards the cap, and stale ones are removed outright.
+        """
+        stale_before_ns = time.time_ns() - self.STALE_TEMP_SECONDS * 1_000_000_000
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith((".raw", ".tmp")):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if name.endswith(".tmp") and stat.st_mtime_ns < stale_before_ns and self._remove(path):
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                total -= size
+
+    @staticmethod
+    def _remove(path):
+        """Deletes a cache file, ignoring files that are gone or still mapped (on Windows)."""
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
 
 
 class ImageProcessor:
@@ -14,9 +222,13 @@ class ImageProcessor:
         self.current_image = None
 
     def set_image(self, image):
-        """Sets the image to be processed."""
+        """
+        Sets the image to be processed.
+        Read-only images (e.g. memory-mapped from the decoded-pixel cache) are kept as the
+        source without copying, since every adjustment starts from a copy of the original.
+        """
         if image is not None:
-            self.original_image = image.copy()
+            self.original_image = image if image.readonly else image.copy()
             self.current_image = image.copy()
         else:
             self.original_image = None